@@ -5,6 +5,7 @@ from logging.config import fileConfig
 
 from alembic import context
 from sqlalchemy.engine import Connection
+from sqlalchemy.schema import SchemaItem
 
 from spoolman.database.database import Database, get_connection_url
 from spoolman.database.models import Base
@@ -16,6 +17,21 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Indexes that migrations only create on some databases, and so aren't declared on the models. Autogenerate must
+# neither add nor drop them.
+MIGRATION_ONLY_INDEXES = frozenset({"ix_print_job_name_trgm"})
+
+
+def include_object(
+    _obj: SchemaItem,
+    name: str | None,
+    type_: str,
+    _reflected: bool,  # noqa: FBT001
+    _compare_to: SchemaItem | None,
+) -> bool:
+    """Exclude objects from autogenerate that aren't managed through the models."""
+    return not (type_ == "index" and name in MIGRATION_ONLY_INDEXES)
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -35,6 +51,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         render_as_batch=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -43,7 +60,7 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations in 'online' mode."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,45 @@
+"""print_job_find_indexes.
+
+Revision ID: 3f9a1c7e2b64
+Revises: 2026_02_15_1529
+Create Date: 2026-10-15 12:00:00.000000
+"""
+
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f9a1c7e2b64"
+down_revision = "2026_02_15_1529"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger(__name__)
+
+
+def upgrade() -> None:
+    """Perform the upgrade."""
+    # Covers filtering on spool_id and ordering by registered, the index can be scanned backwards for DESC
+    op.create_index("ix_print_job_spool_registered", "print_job", ["spool_id", "registered"], unique=False)
+
+    conn = op.get_bind()
+    if conn.dialect.name == "postgresql":
+        # Makes ILIKE '%name%' searches index-usable. The pg_trgm extension may not be installable by this database
+        # user, in which case the index is simply skipped. Since it doesn't always exist it isn't declared on the
+        # model, and env.py excludes it from autogenerate instead.
+        try:
+            with conn.begin_nested():
+                op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                op.execute("CREATE INDEX ix_print_job_name_trgm ON print_job USING gin (name gin_trgm_ops)")
+        except sa.exc.DBAPIError:
+            logger.warning("Could not enable pg_trgm, skipping trigram index on print_job.name.")
+
+
+def downgrade() -> None:
+    """Perform the downgrade."""
+    conn = op.get_bind()
+    if conn.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_print_job_name_trgm")
+    op.drop_index("ix_print_job_spool_registered", table_name="print_job")
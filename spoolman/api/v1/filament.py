@@ -359,7 +359,7 @@ async def find(
     # Set x-total-count header for pagination
     return JSONResponse(
         content=jsonable_encoder(
-            (Filament.from_db(db_item) for db_item in db_items),
+            [Filament.from_db(db_item) for db_item in db_items],
             exclude_none=True,
         ),
         headers={"x-total-count": str(total_count)},
@@ -470,8 +470,11 @@ class PrintJob(BaseModel):
 
     @staticmethod
     def from_db(item: models.PrintJob) -> "PrintJob":
-        """Create a new Pydantic print job object from a database print job object."""
-        return PrintJob(
+        """Create a new Pydantic print job object from a database print job object.
+
+        Validation is skipped since the database columns already have the correct types.
+        """
+        return PrintJob.model_construct(
             id=item.id,
             registered=item.registered,
             spool_id=item.spool_id,
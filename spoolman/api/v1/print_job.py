@@ -2,17 +2,17 @@
 
 import asyncio
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, Depends, Query, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from spoolman.api.v1.models import Message, PrintJob, PrintJobEvent
-from spoolman.database import print_job
+from spoolman.database import models, print_job
 from spoolman.database.database import get_db_session
 from spoolman.ws import websocket_manager
 
@@ -25,8 +25,21 @@ router = APIRouter(
 
 # ruff: noqa: D103
 
+# Reused for every list response so the pydantic-core serializer is only built once
+_PRINT_JOB_LIST_ADAPTER = TypeAdapter(list[PrintJob])
+
+# Lists longer than this are serialized in a worker thread so they don't block the event loop
+SERIALIZE_IN_THREAD_THRESHOLD = 500
+
+
+def _serialize_print_jobs(db_items: Sequence[models.PrintJob]) -> bytes:
+    """Serialize a list of database print job objects to JSON."""
+    return _PRINT_JOB_LIST_ADAPTER.dump_json([PrintJob.from_db(db_item) for db_item in db_items], exclude_none=True)
+
 
 class PrintJobParameters(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     spool_id: int = Field(description="The ID of the spool used for this print job.")
     name: str = Field(max_length=128, description="Name/description of the print job.", examples=["Benchy"])
     weight_used: float = Field(ge=0, description="Weight of filament used for this job in grams.", examples=[15.5])
@@ -54,6 +67,8 @@ class PrintJobParameters(BaseModel):
 
 
 class PrintJobUpdateParameters(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     spool_id: int | None = Field(None, description="The ID of the spool used for this print job.")
     name: str | None = Field(None, max_length=128, description="Name/description of the print job.")
     weight_used: float | None = Field(None, ge=0, description="Weight of filament used for this job in grams.")
@@ -76,6 +91,7 @@ class PrintJobUpdateParameters(BaseModel):
     response_model_exclude_none=True,
     responses={
         200: {"model": list[PrintJob]},
+        400: {"model": Message},
         299: {"model": PrintJobEvent, "description": "Websocket message"},
     },
 )
@@ -95,22 +111,56 @@ async def find(
         Query(title="Limit", description="Maximum number of items in the response."),
     ] = None,
     offset: Annotated[int, Query(title="Offset", description="Offset in the full result set if a limit is set.")] = 0,
-) -> JSONResponse:
+    after: Annotated[
+        str | None,
+        Query(
+            title="After",
+            description=(
+                "Return the items after this cursor, as given by the x-next-cursor header of a previous response. "
+                "Faster than offset for deep pages, and takes precedence over it."
+            ),
+        ),
+    ] = None,
+) -> Response:
+    cursor = None
+    if after is not None:
+        try:
+            registered, item_id = after.split(",")
+            cursor_registered = datetime.fromisoformat(registered)
+            cursor = (
+                # Registered dates are stored as timezone-naive UTC, so a cursor with an offset is converted to match
+                print_job.utc_timezone_naive(cursor_registered)
+                if cursor_registered.tzinfo is not None
+                else cursor_registered,
+                int(item_id),
+            )
+        except ValueError:
+            return JSONResponse(status_code=400, content=Message(message="Invalid cursor.").dict())
+
     db_items, total_count = await print_job.find(
         db=db,
         spool_id=spool_id,
         name=name,
         limit=limit,
         offset=offset,
+        after=cursor,
     )
 
-    # Set x-total-count header for pagination
-    return JSONResponse(
-        content=jsonable_encoder(
-            (PrintJob.from_db(db_item) for db_item in db_items),
-            exclude_none=True,
-        ),
-        headers={"x-total-count": str(total_count)},
+    # Set x-total-count header for pagination, and x-next-cursor if there may be more items
+    headers = {"x-total-count": str(total_count)}
+    if limit and len(db_items) == limit:
+        last_item = db_items[-1]
+        headers["x-next-cursor"] = f"{last_item.registered.isoformat()},{last_item.id}"
+
+    if len(db_items) > SERIALIZE_IN_THREAD_THRESHOLD:
+        content = await asyncio.to_thread(_serialize_print_jobs, db_items)
+    else:
+        content = _serialize_print_jobs(db_items)
+
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers=headers,
     )
 
 
@@ -125,7 +175,7 @@ async def notify_any(
     websocket_manager.connect(("print_job",), websocket)
     try:
         while True:
-            await asyncio.sleep(0.5)
+            # Blocks without waking up until the client sends something
             if await websocket.receive_text():
                 await websocket.send_json({"status": "healthy"})
     except WebSocketDisconnect:
@@ -146,8 +196,7 @@ async def get(
     db: Annotated[AsyncSession, Depends(get_db_session)],
     print_job_id: int,
 ) -> PrintJob:
-    db_item = await print_job.get_by_id(db, print_job_id)
-    return PrintJob.from_db(db_item)
+    return await print_job.get_cached_by_id(db, print_job_id)
 
 
 @router.websocket(
@@ -162,7 +211,7 @@ async def notify(
     websocket_manager.connect(("print_job", str(print_job_id)), websocket)
     try:
         while True:
-            await asyncio.sleep(0.5)
+            # Blocks without waking up until the client sends something
             if await websocket.receive_text():
                 await websocket.send_json({"status": "healthy"})
     except WebSocketDisconnect:
@@ -183,7 +232,7 @@ async def create(  # noqa: ANN201
     db: Annotated[AsyncSession, Depends(get_db_session)],
     body: PrintJobParameters,
 ):
-    db_item = await print_job.create(
+    return await print_job.create(
         db=db,
         spool_id=body.spool_id,
         name=body.name,
@@ -195,7 +244,6 @@ async def create(  # noqa: ANN201
         notes=body.notes,
         external_reference=body.external_reference,
     )
-    return PrintJob.from_db(db_item)
 
 
 @router.patch(
@@ -219,14 +267,12 @@ async def update(  # noqa: ANN201
 ):
     patch_data = body.model_dump(exclude_unset=True)
 
-    db_item = await print_job.update(
+    return await print_job.update(
         db=db,
         print_job_id=print_job_id,
         data=patch_data,
     )
 
-    return PrintJob.from_db(db_item)
-
 
 @router.delete(
     "/{print_job_id}",
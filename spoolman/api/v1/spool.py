@@ -315,7 +315,7 @@ async def find(
     # Set x-total-count header for pagination
     return JSONResponse(
         content=jsonable_encoder(
-            (Spool.from_db(db_item) for db_item in db_items),
+            [Spool.from_db(db_item) for db_item in db_items],
             exclude_none=True,
         ),
         headers={"x-total-count": str(total_count)},
@@ -135,7 +135,7 @@ async def find(
     # Set x-total-count header for pagination
     return JSONResponse(
         content=jsonable_encoder(
-            (Vendor.from_db(db_item) for db_item in db_items),
+            [Vendor.from_db(db_item) for db_item in db_items],
             exclude_none=True,
         ),
         headers={"x-total-count": str(total_count)},
@@ -3,9 +3,9 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, and_, case, select
 from sqlalchemy.ext.asyncio import AsyncAttrs
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, column_property, mapped_column, relationship
 
 
 class Base(AsyncAttrs, DeclarativeBase):
@@ -82,6 +82,18 @@ class Spool(Base):
         lazy="joined",
     )
     print_jobs: Mapped[list["PrintJob"]] = relationship(back_populates="spool")
+    # Price per gram of filament, from the spool's own price if set, otherwise from the filament's price
+    price_per_gram: Mapped[float | None] = column_property(
+        case(
+            (and_(price.is_not(None), initial_weight > 0), price / initial_weight),
+            else_=select(case((Filament.weight > 0, Filament.price / Filament.weight)))
+            .where(Filament.id == filament_id)
+            .correlate_except(Filament)
+            .scalar_subquery(),
+        ),
+        # Only loaded when asked for, so regular spool queries don't pay for the subquery
+        deferred=True,
+    )
 
 
 class Setting(Base):
@@ -121,6 +133,7 @@ class SpoolField(Base):
 
 class PrintJob(Base):
     __tablename__ = "print_job"
+    __table_args__ = (Index("ix_print_job_spool_registered", "spool_id", "registered"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     registered: Mapped[datetime] = mapped_column()
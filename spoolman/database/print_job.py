@@ -1,11 +1,15 @@
 """Helper functions for interacting with print_job database objects."""
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from typing import Any
 
 import sqlalchemy
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from spoolman.api.v1.models import EventType, PrintJob, PrintJobEvent
 from spoolman.database import models, spool
@@ -14,6 +18,67 @@ from spoolman.ws import websocket_manager
 
 logger = logging.getLogger(__name__)
 
+# Per-process cache of PrintJob models, keyed by print job ID. Entries are dropped whenever the ORM writes to a
+# print job, and the TTL bounds staleness from writes made by other processes.
+CACHE_MAX_SIZE = 1024
+CACHE_TTL = 60.0
+
+
+class PrintJobCache:
+    """LRU cache of PrintJob models with a TTL.
+
+    Every invalidation bumps a write counter. A reader takes the counter before querying the database and only stores
+    its result if no write has happened since, so a row read before a concurrent write is committed can't be cached
+    after that write has invalidated the entry.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initialize."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self.items: OrderedDict[int, tuple[float, PrintJob]] = OrderedDict()
+        self.writes = 0
+
+    def generation(self) -> int:
+        """Get the current value of the write counter."""
+        return self.writes
+
+    def get(self, print_job_id: int) -> PrintJob | None:
+        """Get a cached print job, or None if it isn't cached or has expired."""
+        entry = self.items.get(print_job_id)
+        if entry is None:
+            return None
+        expires, item = entry
+        if expires <= time.monotonic():
+            del self.items[print_job_id]
+            return None
+        self.items.move_to_end(print_job_id)
+        return item
+
+    def put(self, print_job_id: int, item: PrintJob, generation: int) -> None:
+        """Cache a print job, unless anything has been invalidated since the given generation was taken."""
+        if generation != self.writes:
+            return
+        self.items[print_job_id] = (time.monotonic() + self.ttl, item)
+        if len(self.items) > self.max_size:
+            self.items.popitem(last=False)
+
+    def invalidate(self, print_job_id: int) -> None:
+        """Remove a print job from the cache."""
+        self.items.pop(print_job_id, None)
+        self.writes += 1
+
+    def clear(self) -> None:
+        """Remove all print jobs from the cache."""
+        self.items.clear()
+        self.writes += 1
+
+
+_cache = PrintJobCache(CACHE_MAX_SIZE, CACHE_TTL)
+
+# Fields that are converted to timezone-naive UTC when updated
+DATETIME_FIELDS = frozenset({"started_at", "completed_at"})
+
 
 def utc_timezone_naive(dt: datetime) -> datetime:
     """Convert a datetime object to UTC and remove timezone info."""
@@ -32,8 +97,8 @@ async def create(
     revenue: float | None = None,
     notes: str | None = None,
     external_reference: str | None = None,
-) -> models.PrintJob:
-    """Add a new print job to the database."""
+) -> PrintJob:
+    """Add a new print job to the database and return it as a Pydantic object."""
     # Verify spool exists
     spool_item = await spool.get_by_id(db, spool_id)
 
@@ -43,21 +108,16 @@ async def create(
     if completed_at is not None:
         completed_at = utc_timezone_naive(completed_at)
 
-    # Calculate cost if not provided
+    # Calculate cost if not provided. price_per_gram is computed by the database when the spool is loaded, but it is
+    # expired whenever the spool is flushed, so it may need to be reloaded.
     if cost is None and weight_used > 0:
-        # Calculate cost based on spool price or filament price
-        price_per_gram = None
-        if spool_item.price is not None and spool_item.initial_weight is not None and spool_item.initial_weight > 0:
-            price_per_gram = spool_item.price / spool_item.initial_weight
-        elif spool_item.filament.price is not None and spool_item.filament.weight is not None and spool_item.filament.weight > 0:
-            price_per_gram = spool_item.filament.price / spool_item.filament.weight
-
+        price_per_gram = await spool_item.awaitable_attrs.price_per_gram
         if price_per_gram is not None:
             cost = weight_used * price_per_gram
 
     print_job = models.PrintJob(
         spool=spool_item,
-        registered=datetime.utcnow().replace(microsecond=0),
+        registered=datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0),
         name=name,
         weight_used=weight_used,
         started_at=started_at,
@@ -69,22 +129,50 @@ async def create(
     )
     db.add(print_job)
     await db.commit()
-    await print_job_changed(print_job, EventType.ADDED)
-    return print_job
+    item = PrintJob.from_db(print_job)
+    await print_job_changed(print_job, EventType.ADDED, prebuilt=item)
+    return item
 
 
 async def get_by_id(db: AsyncSession, print_job_id: int) -> models.PrintJob:
     """Get a print job object from the database by the unique ID."""
-    print_job = await db.get(
-        models.PrintJob,
-        print_job_id,
-        options=[joinedload("*")],  # Load all nested objects as well
-    )
+    # No relationships are loaded, nothing on this path reads them, so this is a single primary key lookup
+    print_job = await db.get(models.PrintJob, print_job_id)
     if print_job is None:
         raise ItemNotFoundError(f"No print job with ID {print_job_id} found.")
     return print_job
 
 
+async def get_cached_by_id(db: AsyncSession, print_job_id: int) -> PrintJob:
+    """Get a print job by the unique ID as a Pydantic object, served from the cache if possible."""
+    item = _cache.get(print_job_id)
+    if item is not None:
+        return item
+
+    generation = _cache.generation()
+    item = PrintJob.from_db(await get_by_id(db, print_job_id))
+    _cache.put(print_job_id, item, generation)
+    return item
+
+
+def invalidate_cache(print_job_id: int) -> None:
+    """Remove a print job from the cache."""
+    _cache.invalidate(print_job_id)
+
+
+@event.listens_for(models.PrintJob, "after_insert")
+@event.listens_for(models.PrintJob, "after_update")
+@event.listens_for(models.PrintJob, "after_delete")
+def _on_print_job_write(_mapper: Any, _connection: Any, target: models.PrintJob) -> None:  # noqa: ANN401
+    invalidate_cache(target.id)
+
+
+@event.listens_for(models.Spool, "after_delete")
+def _on_spool_delete(_mapper: Any, _connection: Any, _target: models.Spool) -> None:  # noqa: ANN401
+    # Deleting a spool also affects all of its print jobs, so drop everything rather than tracking which ones
+    _cache.clear()
+
+
 async def find(
     *,
     db: AsyncSession,
@@ -92,43 +180,65 @@ async def find(
     name: str | None = None,
     limit: int | None = None,
     offset: int = 0,
+    after: tuple[datetime, int] | None = None,
 ) -> tuple[list[models.PrintJob], int]:
     """Find a list of print job objects by search criteria.
 
+    If after is given as a (registered, id) cursor, only items after it in the result order are returned and offset is
+    ignored. This pages through the results with an index range instead of skipping rows.
+
     Returns a tuple containing the list of items and the total count of matching items.
     """
-    stmt = (
-        sqlalchemy.select(models.PrintJob)
-        .join(models.PrintJob.spool)
-        .options(joinedload(models.PrintJob.spool).joinedload(models.Spool.filament))
-    )
-
+    conditions = []
     if spool_id is not None:
-        stmt = stmt.where(models.PrintJob.spool_id == spool_id)
+        conditions.append(models.PrintJob.spool_id == spool_id)
 
     if name is not None:
-        stmt = stmt.where(models.PrintJob.name.ilike(f"%{name}%"))
+        conditions.append(models.PrintJob.name.ilike(f"%{name}%"))
 
-    # Order by registered date descending (newest first)
-    stmt = stmt.order_by(models.PrintJob.registered.desc())
+    stmt = (
+        sqlalchemy.select(models.PrintJob)
+        .where(*conditions)
+        # Order by registered date descending (newest first), with the ID as tie-breaker for a stable cursor
+        .order_by(models.PrintJob.registered.desc(), models.PrintJob.id.desc())
+    )
 
-    total_count = None
+    if after is not None:
+        stmt = stmt.where(
+            sqlalchemy.tuple_(models.PrintJob.registered, models.PrintJob.id) < sqlalchemy.tuple_(*after),
+        )
 
-    if limit is not None:
-        total_count_stmt = stmt.with_only_columns(sqlalchemy.func.count(), maintain_column_froms=True)
-        total_count = (await db.execute(total_count_stmt)).scalar()
+    if limit is None and after is None:
+        rows = await db.execute(
+            stmt,
+            execution_options={"populate_existing": True},
+        )
+        result = list(rows.scalars().all())
+        return result, len(result)
 
-        stmt = stmt.offset(offset).limit(limit)
+    # Count directly on the print_job table, all filters are on its own columns
+    total_count_stmt = sqlalchemy.select(sqlalchemy.func.count(models.PrintJob.id)).where(*conditions)
+    if after is None:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
 
-    rows = await db.execute(
-        stmt,
-        execution_options={"populate_existing": True},
+    # A session can't run two statements at once, so the count runs on its own pooled connection
+    # while the page is fetched through the session.
+    total_count, rows = await asyncio.gather(
+        _count_on_new_connection(db, total_count_stmt),
+        db.execute(
+            stmt,
+            execution_options={"populate_existing": True},
+        ),
     )
-    result = list(rows.unique().scalars().all())
-    if total_count is None:
-        total_count = len(result)
+    return list(rows.scalars().all()), total_count
 
-    return result, total_count
+
+async def _count_on_new_connection(db: AsyncSession, stmt: sqlalchemy.Select) -> int:
+    """Execute a count statement on a separate connection from the session's engine."""
+    async with db.bind.connect() as conn:
+        return (await conn.execute(stmt)).scalar_one()
 
 
 async def update(
@@ -136,17 +246,18 @@ async def update(
     db: AsyncSession,
     print_job_id: int,
     data: dict,
-) -> models.PrintJob:
-    """Update the fields of a print job object."""
+) -> PrintJob:
+    """Update the fields of a print job object and return it as a Pydantic object."""
     print_job = await get_by_id(db, print_job_id)
     for k, v in data.items():
-        if isinstance(v, datetime):
-            setattr(print_job, k, utc_timezone_naive(v))
-        else:
-            setattr(print_job, k, v)
+        setattr(print_job, k, utc_timezone_naive(v) if k in DATETIME_FIELDS and v is not None else v)
     await db.commit()
-    await print_job_changed(print_job, EventType.UPDATED)
-    return print_job
+    # Invalidate again after commit, so a concurrent read that started between the flush and the commit, and thus saw
+    # the old row, doesn't cache it
+    invalidate_cache(print_job_id)
+    item = PrintJob.from_db(print_job)
+    await print_job_changed(print_job, EventType.UPDATED, prebuilt=item)
+    return item
 
 
 async def delete(db: AsyncSession, print_job_id: int) -> None:
@@ -155,18 +266,27 @@ async def delete(db: AsyncSession, print_job_id: int) -> None:
     await print_job_changed(print_job, EventType.DELETED)
     await db.delete(print_job)
     await db.commit()
+    invalidate_cache(print_job_id)
 
 
-async def print_job_changed(print_job: models.PrintJob, typ: EventType) -> None:
-    """Notify websocket clients that a print job has changed."""
+async def print_job_changed(
+    print_job: models.PrintJob,
+    typ: EventType,
+    *,
+    prebuilt: PrintJob | None = None,
+) -> None:
+    """Notify websocket clients that a print job has changed.
+
+    If the caller has already built the Pydantic object for the print job, it can be passed as prebuilt to reuse it.
+    """
     try:
         await websocket_manager.send(
             ("print_job", str(print_job.id)),
             PrintJobEvent(
                 type=typ,
                 resource="print_job",
-                date=datetime.utcnow(),
-                payload=PrintJob.from_db(print_job),
+                date=datetime.now(timezone.utc),
+                payload=prebuilt if prebuilt is not None else PrintJob.from_db(print_job),
             ),
         )
     except Exception:
@@ -126,7 +126,7 @@ def add_cors_middleware() -> None:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["X-Total-Count"],
+        expose_headers=["X-Total-Count", "X-Next-Cursor"],
     )
 
 
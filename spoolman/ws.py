@@ -1,6 +1,8 @@
 """Websocket functionality."""
 
+import asyncio
 import logging
+from collections.abc import Callable
 
 from fastapi import WebSocket
 from starlette.websockets import WebSocketState
@@ -43,16 +45,26 @@ class SubscriptionTree:
         elif path[0] in self.children:
             self.children[path[0]].remove(path[1:], websocket)
 
-    async def send(self, path: tuple[str, ...], evt: Event) -> None:
-        """Send a message to all websockets in this branch of the tree."""
-        # Broadcast to all subscribers on this level
-        for websocket in self.subscribers:
+    def send(
+        self,
+        path: tuple[str, ...],
+        message: str,
+        publish: Callable[[WebSocket, str], None],
+        discard: Callable[[WebSocket], None],
+    ) -> None:
+        """Publish an already serialized message to all websockets in this branch of the tree.
+
+        Websockets found to be disconnected are removed from the tree and passed to discard.
+        """
+        # Broadcast to all subscribers on this level, iterating over a copy since dead websockets are removed
+        for websocket in list(self.subscribers):
             if (
                 websocket.client_state == WebSocketState.DISCONNECTED  # noqa: PLR1714
                 or websocket.application_state == WebSocketState.DISCONNECTED
             ):
-                # A bad disconnection may have occurred
-                self.remove(path, websocket)
+                # A bad disconnection may have occurred, drop it from this level of the tree
+                self.subscribers.discard(websocket)
+                discard(websocket)
                 logger.info(
                     "Forcing disconnection of client %s on pool %s",
                     websocket.client.host if websocket.client else "?",
@@ -62,23 +74,37 @@ class SubscriptionTree:
                 websocket.client_state == WebSocketState.CONNECTED
                 and websocket.application_state == WebSocketState.CONNECTED
             ):
-                await websocket.send_text(evt.json())
+                publish(websocket, message)
 
         # Send the message further down the tree
         if len(path) > 0 and path[0] in self.children:
-            await self.children[path[0]].send(path[1:], evt)
+            self.children[path[0]].send(path[1:], message, publish, discard)
 
 
 class WebsocketManager:
-    """Websocket manager."""
+    """Websocket manager.
+
+    Every connected websocket gets its own outbound queue, drained by a dedicated writer task. Publishing a message
+    only puts it on the queues, so a slow client can't hold up the sender or the other clients.
+    """
+
+    queue_size = 256
 
     def __init__(self) -> None:
         """Initialize."""
         self.tree = SubscriptionTree()
+        self.queues: dict[WebSocket, asyncio.Queue[str]] = {}
+        self.writers: dict[WebSocket, asyncio.Task[None]] = {}
+        # Websockets that have had messages dropped since their queue was last empty
+        self.lagging: set[WebSocket] = set()
 
     def connect(self, pool: tuple[str, ...], websocket: WebSocket) -> None:
         """Connect a websocket."""
         self.tree.add(pool, websocket)
+        if websocket not in self.queues:
+            queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self.queue_size)
+            self.queues[websocket] = queue
+            self.writers[websocket] = asyncio.create_task(self._write(websocket, queue))
         logger.info(
             "Client %s is now listening on pool %s",
             websocket.client.host if websocket.client else "?",
@@ -88,6 +114,7 @@ class WebsocketManager:
     def disconnect(self, pool: tuple[str, ...], websocket: WebSocket) -> None:
         """Disconnect a websocket."""
         self.tree.remove(pool, websocket)
+        self._stop_writer(websocket)
         logger.info(
             "Client %s has stopped listening on pool %s",
             websocket.client.host if websocket.client else "?",
@@ -96,7 +123,45 @@ class WebsocketManager:
 
     async def send(self, pool: tuple[str, ...], evt: Event) -> None:
         """Send a message to all websockets in a pool."""
-        await self.tree.send(pool, evt)
+        # Serialize once up front, not once per subscriber
+        self.tree.send(pool, evt.model_dump_json(), self._publish, self._stop_writer)
+
+    def _stop_writer(self, websocket: WebSocket) -> None:
+        """Drop a websocket's outbound queue and stop its writer task."""
+        self.queues.pop(websocket, None)
+        self.lagging.discard(websocket)
+        writer = self.writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    def _publish(self, websocket: WebSocket, message: str) -> None:
+        """Put a message on a websocket's outbound queue, dropping the oldest message if the client can't keep up."""
+        queue = self.queues.get(websocket)
+        if queue is None:
+            return
+        if queue.full():
+            queue.get_nowait()
+            # Only warn once until the client has caught up again
+            if websocket not in self.lagging:
+                self.lagging.add(websocket)
+                logger.warning(
+                    "Client %s is not keeping up, dropping its oldest queued messages",
+                    websocket.client.host if websocket.client else "?",
+                )
+        queue.put_nowait(message)
+
+    async def _write(self, websocket: WebSocket, queue: asyncio.Queue[str]) -> None:
+        """Send queued messages to a websocket until it disconnects."""
+        while True:
+            message = await queue.get()
+            try:
+                await websocket.send_text(message)
+            except Exception:  # noqa: BLE001
+                # The client has gone away, stop queueing messages for it
+                self._stop_writer(websocket)
+                return
+            if queue.empty():
+                self.lagging.discard(websocket)
 
 
 websocket_manager = WebsocketManager()
@@ -0,0 +1,43 @@
+"""Tests for the websocket subscription tree."""
+
+from starlette.websockets import WebSocketState
+
+from spoolman.ws import SubscriptionTree
+
+
+class FakeWebSocket:
+    """Stand-in for a websocket, only carrying the connection state."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.client = None
+        self.client_state = WebSocketState.CONNECTED
+        self.application_state = WebSocketState.CONNECTED
+
+
+def test_send_drops_dead_websocket_on_parent_level():
+    # Setup
+    tree = SubscriptionTree()
+    dead = FakeWebSocket()
+    live = FakeWebSocket()
+    child = FakeWebSocket()
+    tree.add(("print_job",), dead)
+    tree.add(("print_job",), live)
+    tree.add(("print_job", "5"), child)
+    dead.client_state = WebSocketState.DISCONNECTED
+
+    published = []
+    discarded = []
+
+    # Execute
+    tree.send(
+        ("print_job", "5"),
+        "message",
+        lambda websocket, message: published.append((websocket, message)),
+        discarded.append,
+    )
+
+    # Verify
+    assert discarded == [dead]
+    assert published == [(live, "message"), (child, "message")]
+    assert dead not in tree.children["print_job"].subscribers
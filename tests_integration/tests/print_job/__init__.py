@@ -0,0 +1 @@
+"""Tests for the print job API."""
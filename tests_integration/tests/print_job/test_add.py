@@ -0,0 +1,172 @@
+"""Integration tests for the Print Job API endpoint."""
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+import pytest
+
+from ..conftest import URL, assert_dicts_compatible
+
+
+@pytest.fixture
+def spool(random_filament: dict[str, Any]) -> Iterable[dict[str, Any]]:
+    """Add a spool without a price of its own."""
+    result = httpx.post(f"{URL}/api/v1/spool", json={"filament_id": random_filament["id"]})
+    result.raise_for_status()
+    spool = result.json()
+    yield spool
+    httpx.delete(f"{URL}/api/v1/spool/{spool['id']}").raise_for_status()
+
+
+def test_add_print_job(spool: dict[str, Any]):
+    """Test adding a print job to the database."""
+    # Execute
+    result = httpx.post(
+        f"{URL}/api/v1/print-job",
+        json={
+            "spool_id": spool["id"],
+            "name": "Benchy",
+            "weight_used": 15.5,
+            "started_at": "2023-01-01T12:00:00+02:00",
+            "completed_at": "2023-01-01T11:30:00Z",
+            "cost": 1.5,
+            "revenue": 5,
+            "notes": "abcdefghåäö",
+            "external_reference": "benchy.gcode",
+        },
+    )
+    result.raise_for_status()
+
+    # Verify
+    print_job = result.json()
+    assert_dicts_compatible(
+        print_job,
+        {
+            "id": print_job["id"],
+            "registered": print_job["registered"],
+            "spool_id": spool["id"],
+            "name": "Benchy",
+            "weight_used": 15.5,
+            "started_at": "2023-01-01T10:00:00Z",
+            "completed_at": "2023-01-01T11:30:00Z",
+            "cost": 1.5,
+            "revenue": 5,
+            "notes": "abcdefghåäö",
+            "external_reference": "benchy.gcode",
+        },
+    )
+
+    # Verify that registered happened almost now (within 1 minute)
+    diff = abs((datetime.now(tz=timezone.utc) - datetime.fromisoformat(print_job["registered"])).total_seconds())
+    assert diff < 60
+
+    # Clean up
+    httpx.delete(f"{URL}/api/v1/print-job/{print_job['id']}").raise_for_status()
+
+
+def test_add_print_job_naive_datetime(spool: dict[str, Any]):
+    """Test that datetimes without a timezone are taken as the server's local time."""
+    # Execute
+    result = httpx.post(
+        f"{URL}/api/v1/print-job",
+        json={"spool_id": spool["id"], "name": "Benchy", "weight_used": 10, "started_at": "2023-01-01T12:00:00"},
+    )
+    result.raise_for_status()
+    print_job = result.json()
+
+    try:
+        # Verify, the tester runs in the same timezone as the server, so local time here is local time there
+        assert datetime.fromisoformat(print_job["started_at"]) == datetime(2023, 1, 1, 12).astimezone(timezone.utc)
+    finally:
+        # Clean up
+        httpx.delete(f"{URL}/api/v1/print-job/{print_job['id']}").raise_for_status()
+
+
+def test_add_print_job_cost_from_filament_price(spool: dict[str, Any]):
+    """Test that the cost is calculated from the filament price if the spool has no price."""
+    # Execute
+    result = httpx.post(
+        f"{URL}/api/v1/print-job",
+        json={"spool_id": spool["id"], "name": "Benchy", "weight_used": 10},
+    )
+    result.raise_for_status()
+
+    # Verify, the filament costs 100 for 1000 g
+    print_job = result.json()
+    assert print_job["cost"] == pytest.approx(1.0)
+
+    # Clean up
+    httpx.delete(f"{URL}/api/v1/print-job/{print_job['id']}").raise_for_status()
+
+
+def test_add_print_job_cost_from_spool_price(random_filament: dict[str, Any]):
+    """Test that the cost is calculated from the spool price if it has one."""
+    # Setup
+    result = httpx.post(
+        f"{URL}/api/v1/spool",
+        json={"filament_id": random_filament["id"], "price": 30, "initial_weight": 500},
+    )
+    result.raise_for_status()
+    spool = result.json()
+
+    # Execute
+    result = httpx.post(
+        f"{URL}/api/v1/print-job",
+        json={"spool_id": spool["id"], "name": "Benchy", "weight_used": 10},
+    )
+    result.raise_for_status()
+
+    # Verify
+    print_job = result.json()
+    assert print_job["cost"] == pytest.approx(0.6)
+
+    # Clean up
+    httpx.delete(f"{URL}/api/v1/print-job/{print_job['id']}").raise_for_status()
+    httpx.delete(f"{URL}/api/v1/spool/{spool['id']}").raise_for_status()
+
+
+def test_add_print_job_no_price(random_empty_filament: dict[str, Any]):
+    """Test that no cost is set if neither the spool nor the filament has a price."""
+    # Setup
+    result = httpx.post(f"{URL}/api/v1/spool", json={"filament_id": random_empty_filament["id"]})
+    result.raise_for_status()
+    spool = result.json()
+
+    # Execute
+    result = httpx.post(
+        f"{URL}/api/v1/print-job",
+        json={"spool_id": spool["id"], "name": "Benchy", "weight_used": 10},
+    )
+    result.raise_for_status()
+
+    # Verify
+    print_job = result.json()
+    assert "cost" not in print_job
+
+    # Clean up
+    httpx.delete(f"{URL}/api/v1/print-job/{print_job['id']}").raise_for_status()
+    httpx.delete(f"{URL}/api/v1/spool/{spool['id']}").raise_for_status()
+
+
+def test_use_spool_creates_print_job_with_cost(spool: dict[str, Any]):
+    """Test that using a spool with a job name creates a print job with a calculated cost."""
+    # Execute
+    result = httpx.put(
+        f"{URL}/api/v1/spool/{spool['id']}/use",
+        json={"use_weight": 20, "job_name": "Benchy"},
+    )
+    result.raise_for_status()
+
+    # Verify
+    result = httpx.get(f"{URL}/api/v1/print-job", params={"spool_id": spool["id"]})
+    result.raise_for_status()
+    print_jobs = result.json()
+    assert len(print_jobs) == 1
+    assert print_jobs[0]["name"] == "Benchy"
+    assert print_jobs[0]["weight_used"] == pytest.approx(20)
+    assert print_jobs[0]["cost"] == pytest.approx(2.0)
+
+    # Clean up
+    httpx.delete(f"{URL}/api/v1/print-job/{print_jobs[0]['id']}").raise_for_status()
@@ -0,0 +1,52 @@
+"""Integration tests for the Print Job API endpoint."""
+
+from typing import Any
+
+import httpx
+
+from ..conftest import URL
+
+
+def test_delete_print_job(random_filament: dict[str, Any]):
+    """Test deleting a print job from the database."""
+    # Setup
+    result = httpx.post(f"{URL}/api/v1/spool", json={"filament_id": random_filament["id"]})
+    result.raise_for_status()
+    spool = result.json()
+
+    result = httpx.post(
+        f"{URL}/api/v1/print-job",
+        json={"spool_id": spool["id"], "name": "Benchy", "weight_used": 10},
+    )
+    result.raise_for_status()
+    added_print_job = result.json()
+
+    # Fetch it once so it is cached before the delete
+    httpx.get(f"{URL}/api/v1/print-job/{added_print_job['id']}").raise_for_status()
+
+    # Execute
+    httpx.delete(
+        f"{URL}/api/v1/print-job/{added_print_job['id']}",
+    ).raise_for_status()
+
+    # Verify
+    result = httpx.get(
+        f"{URL}/api/v1/print-job/{added_print_job['id']}",
+    )
+    assert result.status_code == 404
+
+    # Clean up
+    httpx.delete(f"{URL}/api/v1/spool/{spool['id']}").raise_for_status()
+
+
+def test_delete_print_job_not_found():
+    """Test deleting a print job that does not exist."""
+    # Execute
+    result = httpx.delete(f"{URL}/api/v1/print-job/123456789")
+
+    # Verify
+    assert result.status_code == 404
+    message = result.json()["message"].lower()
+    assert "print job" in message
+    assert "id" in message
+    assert "123456789" in message
@@ -0,0 +1,143 @@
+"""Integration tests for the Print Job API endpoint."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+import pytest
+
+from ..conftest import URL, assert_httpx_code
+
+
+@dataclass
+class Fixture:
+    print_jobs: list[dict[str, Any]]
+    spool: dict[str, Any]
+
+
+@pytest.fixture(scope="module")
+def print_jobs(random_filament_mod: dict[str, Any]) -> Iterable[Fixture]:
+    """Add some print jobs to the database."""
+    result = httpx.post(
+        f"{URL}/api/v1/spool",
+        json={"filament_id": random_filament_mod["id"]},
+    )
+    result.raise_for_status()
+    spool = result.json()
+
+    print_jobs = []
+    for name in ["Benchy", "Calibration cube", "Benchy v2"]:
+        result = httpx.post(
+            f"{URL}/api/v1/print-job",
+            json={"spool_id": spool["id"], "name": name, "weight_used": 10},
+        )
+        result.raise_for_status()
+        print_jobs.append(result.json())
+
+    yield Fixture(
+        print_jobs=print_jobs,
+        spool=spool,
+    )
+
+    for print_job in print_jobs:
+        httpx.delete(f"{URL}/api/v1/print-job/{print_job['id']}").raise_for_status()
+    httpx.delete(f"{URL}/api/v1/spool/{spool['id']}").raise_for_status()
+
+
+def test_find_all_print_jobs(print_jobs: Fixture):
+    # Execute
+    result = httpx.get(f"{URL}/api/v1/print-job", params={"spool_id": print_jobs.spool["id"]})
+    result.raise_for_status()
+
+    # Verify
+    assert result.headers["X-Total-Count"] == "3"
+    assert result.json() == list(reversed(print_jobs.print_jobs))
+
+
+def test_find_print_jobs_by_name(print_jobs: Fixture):
+    # Execute
+    result = httpx.get(f"{URL}/api/v1/print-job", params={"spool_id": print_jobs.spool["id"], "name": "benchy"})
+    result.raise_for_status()
+
+    # Verify
+    assert result.json() == [print_jobs.print_jobs[2], print_jobs.print_jobs[0]]
+
+
+def test_find_print_jobs_limit_offset(print_jobs: Fixture):
+    # Execute
+    result = httpx.get(
+        f"{URL}/api/v1/print-job",
+        params={"spool_id": print_jobs.spool["id"], "limit": 2, "offset": 1},
+    )
+    result.raise_for_status()
+
+    # Verify
+    assert result.headers["X-Total-Count"] == "3"
+    assert result.json() == [print_jobs.print_jobs[1], print_jobs.print_jobs[0]]
+
+
+def test_find_print_jobs_cursor(print_jobs: Fixture):
+    # Execute
+    result = httpx.get(f"{URL}/api/v1/print-job", params={"spool_id": print_jobs.spool["id"], "limit": 2})
+    result.raise_for_status()
+    first_page = result.json()
+
+    result = httpx.get(
+        f"{URL}/api/v1/print-job",
+        params={"spool_id": print_jobs.spool["id"], "limit": 2, "after": result.headers["X-Next-Cursor"]},
+    )
+    result.raise_for_status()
+    second_page = result.json()
+
+    # Verify
+    assert result.headers["X-Total-Count"] == "3"
+    assert "X-Next-Cursor" not in result.headers
+    assert first_page == [print_jobs.print_jobs[2], print_jobs.print_jobs[1]]
+    assert second_page == [print_jobs.print_jobs[0]]
+
+
+def test_find_print_jobs_cursor_without_limit(print_jobs: Fixture):
+    # Setup
+    result = httpx.get(f"{URL}/api/v1/print-job", params={"spool_id": print_jobs.spool["id"], "limit": 1})
+    result.raise_for_status()
+
+    # Execute
+    result = httpx.get(
+        f"{URL}/api/v1/print-job",
+        params={"spool_id": print_jobs.spool["id"], "after": result.headers["X-Next-Cursor"]},
+    )
+    result.raise_for_status()
+
+    # Verify
+    assert result.headers["X-Total-Count"] == "3"
+    assert result.json() == [print_jobs.print_jobs[1], print_jobs.print_jobs[0]]
+
+
+def test_find_print_jobs_cursor_with_offset(print_jobs: Fixture):
+    # Setup
+    result = httpx.get(f"{URL}/api/v1/print-job", params={"spool_id": print_jobs.spool["id"], "limit": 1})
+    result.raise_for_status()
+    registered, item_id = result.headers["X-Next-Cursor"].split(",")
+    registered_local = (
+        datetime.fromisoformat(registered).replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=2)))
+    )
+
+    # Execute
+    result = httpx.get(
+        f"{URL}/api/v1/print-job",
+        params={"spool_id": print_jobs.spool["id"], "limit": 2, "after": f"{registered_local.isoformat()},{item_id}"},
+    )
+    result.raise_for_status()
+
+    # Verify
+    assert result.json() == [print_jobs.print_jobs[1], print_jobs.print_jobs[0]]
+
+
+def test_find_print_jobs_invalid_cursor(print_jobs: Fixture):  # noqa: ARG001
+    # Execute
+    result = httpx.get(f"{URL}/api/v1/print-job", params={"limit": 2, "after": "not-a-cursor"})
+
+    # Verify
+    assert_httpx_code(result, 400)
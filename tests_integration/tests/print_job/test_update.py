@@ -0,0 +1,78 @@
+"""Integration tests for the Print Job API endpoint."""
+
+from typing import Any
+
+import httpx
+
+from ..conftest import URL
+
+
+def test_update_print_job(random_filament: dict[str, Any]):
+    """Test update a print job in the database."""
+    # Setup
+    result = httpx.post(f"{URL}/api/v1/spool", json={"filament_id": random_filament["id"]})
+    result.raise_for_status()
+    spool = result.json()
+
+    result = httpx.post(
+        f"{URL}/api/v1/print-job",
+        json={"spool_id": spool["id"], "name": "Benchy", "weight_used": 10},
+    )
+    result.raise_for_status()
+    added_print_job = result.json()
+
+    # Fetch it once so it is cached before the update
+    result = httpx.get(f"{URL}/api/v1/print-job/{added_print_job['id']}")
+    result.raise_for_status()
+    assert result.json() == added_print_job
+
+    # Execute
+    result = httpx.patch(
+        f"{URL}/api/v1/print-job/{added_print_job['id']}",
+        json={
+            "name": "Benchy v2",
+            "started_at": "2023-01-01T12:00:00+02:00",
+            "completed_at": "2023-01-01T13:30:00Z",
+            "notes": None,
+        },
+    )
+    result.raise_for_status()
+
+    # Verify
+    print_job = result.json()
+    assert print_job["name"] == "Benchy v2"
+    assert print_job["started_at"] == "2023-01-01T10:00:00Z"
+    assert print_job["completed_at"] == "2023-01-01T13:30:00Z"
+    assert "notes" not in print_job
+    assert print_job["id"] == added_print_job["id"]
+    assert print_job["registered"] == added_print_job["registered"]
+
+    result = httpx.get(f"{URL}/api/v1/print-job/{added_print_job['id']}")
+    result.raise_for_status()
+    assert result.json() == print_job
+
+    # Clean up
+    httpx.delete(f"{URL}/api/v1/print-job/{print_job['id']}").raise_for_status()
+    httpx.delete(f"{URL}/api/v1/spool/{spool['id']}").raise_for_status()
+
+
+def test_update_print_job_not_found():
+    """Test updating a print job that does not exist."""
+    # Execute
+    result = httpx.patch(f"{URL}/api/v1/print-job/123456789", json={"name": "Benchy"})
+
+    # Verify
+    assert result.status_code == 404
+    message = result.json()["message"].lower()
+    assert "print job" in message
+    assert "id" in message
+    assert "123456789" in message
+
+
+def test_update_print_job_unknown_field():
+    """Test that unknown fields are rejected instead of silently ignored."""
+    # Execute
+    result = httpx.patch(f"{URL}/api/v1/print-job/123456789", json={"weight": 10})
+
+    # Verify
+    assert result.status_code == 422